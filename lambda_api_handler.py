@@ -20,13 +20,20 @@ WHY SEPARATE FROM TELEMETRY HANDLER:
 TRIGGERED BY: API Gateway HTTP requests
 """
 
-import json
+import base64
+import gzip
 import boto3
+import orjson
 import os
 import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 from decimal import Decimal
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
 
 # ==============================================================================
 # CONFIGURATION
@@ -36,129 +43,373 @@ from boto3.dynamodb.conditions import Key
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Attribute names present on every LogRecord, captured once
+# WHY: Anything not in this set came in via extra= and belongs in the log
+_LOG_RECORD_DEFAULTS = frozenset(
+    vars(logging.LogRecord('', 0, '', 0, '', (), None))
+) | {'message', 'asctime'}
+
+
+class JsonLogFormatter(logging.Formatter):
+    """
+    Emit one JSON object per log line via orjson
+
+    WHY THIS FORMATTER:
+    - JSON log lines are directly queryable in CloudWatch Logs Insights
+    - orjson serializes the record faster than %-interpolating a format
+      string plus manual field concatenation
+    - Fields passed via extra= (http_method, path, ...) come out as
+      first-class JSON keys instead of being lost
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'level': record.levelname,
+            'message': record.getMessage()
+        }
+        # Lift extra= fields into the entry
+        for key, value in record.__dict__.items():
+            if key not in _LOG_RECORD_DEFAULTS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+# Install on whatever handlers the Lambda runtime pre-configured
+for _handler in logger.handlers:
+    _handler.setFormatter(JsonLogFormatter())
+
+# Shared botocore configuration
+# WHY TCP KEEPALIVE: Without it the HTTPS connection is torn down between
+#   warm invocations, forcing a fresh TLS handshake (~50-100ms) per request
+# WHY TIGHT TIMEOUTS: DynamoDB answers in single-digit ms; failing fast and
+#   retrying beats waiting out the 60s botocore defaults
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=5,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
 # Initialize DynamoDB client
 # WHY: Reuse client across Lambda invocations (container reuse)
-dynamodb = boto3.resource('dynamodb')
+# WHY LOW-LEVEL CLIENT: The Table resource wraps every call in pure-Python
+#   dispatch and rebuilds (de)serializers per call; the client plus one
+#   reused TypeDeserializer cuts that overhead on every read
+dynamodb_client = boto3.client('dynamodb', config=BOTO_CONFIG)
 
 # Get table name from environment variable
 DYNAMODB_TABLE_NAME = os.environ['DYNAMODB_TABLE_NAME']
-table = dynamodb.Table(DYNAMODB_TABLE_NAME)
+
+# Single deserializer instance reused for every item
+# WHY: Stateless and thread-safe, shared by all scan segment threads
+deserializer = TypeDeserializer()
+
+# Number of parallel scan segments
+# WHY: DynamoDB splits the table into segments scanned concurrently,
+#      so total scan latency approaches the slowest segment instead of
+#      the sum of all pages fetched one at a time
+SCAN_SEGMENTS = 4
+
+# In-memory cache for the stations scan
+# WHY: Warm Lambda containers live 5-15 minutes while station state only
+#      changes on a seconds scale - a short TTL cache in the execution
+#      context means most GET /stations requests skip DynamoDB entirely
+# WHY A LOCK: API Gateway can invoke the same container concurrently
+STATIONS_CACHE_TTL_SECONDS = 5.0
+_stations_cache = {'expires': 0.0, 'items': None}
+_stations_cache_lock = threading.Lock()
+
+# Default response headers, built once at import time
+# WHY: CORS allows browser-based clients to call API
+# WHY MODULE SCOPE: The common path (no custom headers) reuses this dict
+#   by reference instead of rebuilding five entries per request
+DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',  # CORS: Allow all origins
+    'Access-Control-Allow-Methods': 'GET, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+}
+
+# Minimum body size worth compressing
+# WHY: Below ~1KB the gzip header/dictionary overhead eats the savings;
+#      above it JSON typically shrinks 60-80%
+GZIP_MIN_BYTES = 1024
+
+# DynamoDB BatchGetItem limit
+# WHY: The API accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+
+# Attributes the stations list actually serves
+# WHY PROJECT: Without a projection the scan returns every attribute of
+#   every item, paying RCUs, bandwidth, and unmarshalling time for fields
+#   the API never emits (e.g. lambda_processed_at)
+# NOTE: 'status' and 'timestamp' are DynamoDB reserved words, hence the
+#       ExpressionAttributeNames placeholders
+SCAN_PROJECTION = (
+    'station_id, battery_available, battery_charging, temperature, '
+    'humidity, #s, total_swaps_today, last_swap_time, #ts'
+)
+SCAN_ATTRIBUTE_NAMES = {'#s': 'status', '#ts': 'timestamp'}
 
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
-def decimal_to_float(obj: Any) -> Any:
+def json_default(obj: Any) -> Any:
     """
-    Convert Decimal objects to float for JSON serialization
-    
+    Fallback serializer for types orjson doesn't handle natively
+
     WHY THIS FUNCTION:
     - DynamoDB returns numbers as Decimal type
     - JSON doesn't support Decimal (only float/int)
-    - Must convert before returning to API Gateway
-    
+    - Letting orjson invoke this hook during serialization converts
+      Decimals in the same C-level walk that writes the JSON, instead
+      of rebuilding the whole object tree in Python first
+
     Args:
-        obj: Object potentially containing Decimal values
-        
+        obj: Object orjson could not serialize natively
+
     Returns:
-        Object with Decimals converted to float
+        JSON-compatible replacement value
     """
     if isinstance(obj, Decimal):
         # Convert Decimal to float or int
         # WHY: Preserves integer values as int (not 12.0)
         return int(obj) if obj % 1 == 0 else float(obj)
-    elif isinstance(obj, dict):
-        # Recursively convert dictionary values
-        return {key: decimal_to_float(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        # Recursively convert list items
-        return [decimal_to_float(item) for item in obj]
-    else:
-        return obj
+    # Fallback for anything else (datetime handled natively by orjson)
+    return str(obj)
+
+
+def deserialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a raw DynamoDB item to plain Python values
+
+    WHY THIS FUNCTION:
+    - The low-level client returns attribute values in wire format
+      ({'S': ...}, {'N': ...}); one pass through the shared deserializer
+      yields the dict shape the API serves
+
+    Args:
+        item: Item in DynamoDB wire format
+
+    Returns:
+        Item as a plain dictionary (numbers become Decimal)
+    """
+    return {key: deserializer.deserialize(value) for key, value in item.items()}
 
 
-def create_response(status_code: int, body: Any, headers: Dict[str, str] = None) -> Dict[str, Any]:
+def serialize_stations_body(stations: List[Dict[str, Any]]) -> bytearray:
+    """
+    Serialize the stations list response one item at a time
+
+    WHY THIS FUNCTION:
+    - orjson.dumps on the whole {'count', 'stations'} envelope builds one
+      huge buffer from one huge object graph; at 10k+ stations that spikes
+      memory and GC
+    - Appending per-item chunks to a bytearray keeps the peak allocation
+      at one station plus the growing output buffer
+
+    Args:
+        stations: Station dictionaries (raw DynamoDB values allowed)
+
+    Returns:
+        Serialized JSON body as a bytearray
+    """
+
+    buf = bytearray(b'{"count":')
+    buf += str(len(stations)).encode()
+    buf += b',"stations":['
+    for index, station in enumerate(stations):
+        if index:
+            buf += b','
+        buf += orjson.dumps(
+            station,
+            default=json_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+    buf += b']}'
+    return buf
+
+
+def accepts_gzip(event: Dict[str, Any]) -> bool:
+    """
+    Check whether the client's Accept-Encoding allows gzip
+
+    WHY THIS FUNCTION:
+    - Compressing for a client that can't decompress breaks the response
+    - API Gateway passes request headers through with original casing,
+      so the lookup has to be case-insensitive
+
+    Args:
+        event: API Gateway event (or None when no request context exists)
+
+    Returns:
+        True if the request advertised gzip support
+    """
+
+    if not event:
+        return False
+
+    request_headers = event.get('headers') or {}
+    for name, value in request_headers.items():
+        if name.lower() == 'accept-encoding':
+            return 'gzip' in value.lower()
+    return False
+
+
+def create_response(
+    status_code: int,
+    body: Any,
+    headers: Dict[str, str] = None,
+    event: Dict[str, Any] = None
+) -> Dict[str, Any]:
     """
     Create standardized API Gateway response
-    
+
     WHY THIS FUNCTION:
     - API Gateway requires specific response format
     - Ensures consistent CORS headers
     - Centralizes response structure
-    
+
     Args:
         status_code: HTTP status code (200, 404, 500, etc.)
         body: Response data (will be JSON-serialized)
         headers: Optional additional headers
-        
+        event: Originating API Gateway event, used to honor the client's
+               Accept-Encoding for large responses
+
     Returns:
         Dictionary formatted for API Gateway
     """
-    
-    # Default headers
-    # WHY: CORS allows browser-based clients to call API
-    default_headers = {
-        'Content-Type': 'application/json',
-        'Access-Control-Allow-Origin': '*',  # CORS: Allow all origins
-        'Access-Control-Allow-Methods': 'GET, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type'
-    }
-    
-    # Merge with custom headers if provided
-    if headers:
-        default_headers.update(headers)
-    
+
+    # Merge custom headers over the shared defaults if provided
+    # WHY: Copy only when needed - API Gateway never mutates the response
+    #      headers, so handing out the shared dict by reference is safe
+    response_headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
+
+    # Serialize with orjson (C extension)
+    # WHY: 5-6x faster than stdlib json and emits bytes in a single pass -
+    #      on large /stations responses serialization dominates Lambda CPU
+    # NOTE: json_default converts DynamoDB Decimals inline, so handlers can
+    #       pass raw DynamoDB items without a separate conversion walk
+    # NOTE: bytes pass through untouched for handlers that serialize
+    #       incrementally themselves (see serialize_stations_body)
+    if isinstance(body, (bytes, bytearray)):
+        body_bytes = bytes(body)
+    else:
+        body_bytes = orjson.dumps(
+            body,
+            default=json_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+    # Gzip large bodies when the client accepts them
+    # WHY: JSON compresses 60-80%, cutting egress bytes and client-side
+    #      latency on big /stations responses; API Gateway carries binary
+    #      bodies as base64 with isBase64Encoded=True
+    if len(body_bytes) > GZIP_MIN_BYTES and accepts_gzip(event):
+        compressed = gzip.compress(body_bytes, compresslevel=6)
+        return {
+            'statusCode': status_code,
+            'headers': {**response_headers, 'Content-Encoding': 'gzip'},
+            'body': base64.b64encode(compressed).decode(),
+            'isBase64Encoded': True
+        }
+
     return {
         'statusCode': status_code,
-        'headers': default_headers,
-        'body': json.dumps(body, default=str)  # default=str handles datetime
+        'headers': response_headers,
+        'body': body_bytes.decode()  # API Gateway (REST API) requires a str body
     }
 
 
+def scan_segment(segment: int) -> List[Dict[str, Any]]:
+    """
+    Scan one parallel-scan segment of the table
+
+    WHY THIS FUNCTION:
+    - Each segment is an independent slice DynamoDB scans server-side
+    - The paginator handles LastEvaluatedKey continuation automatically,
+      so no manual while-loop can miss a page
+
+    Args:
+        segment: Segment index (0 to SCAN_SEGMENTS - 1)
+
+    Returns:
+        List of items in this segment
+    """
+
+    paginator = dynamodb_client.get_paginator('scan')
+
+    items: List[Dict[str, Any]] = []
+    for page in paginator.paginate(
+        TableName=DYNAMODB_TABLE_NAME,
+        Segment=segment,
+        TotalSegments=SCAN_SEGMENTS,
+        ProjectionExpression=SCAN_PROJECTION,
+        ExpressionAttributeNames=SCAN_ATTRIBUTE_NAMES,
+        PaginationConfig={'PageSize': 1000}
+    ):
+        items.extend(deserialize_item(item) for item in page.get('Items', []))
+
+    return items
+
+
 def get_all_stations() -> List[Dict[str, Any]]:
     """
     Retrieve all stations from DynamoDB
-    
+
     WHY SCAN OPERATION:
     - Need all items in table (no specific partition key)
     - Acceptable for small datasets (<100 stations)
     - For large datasets, would use pagination or GSI
-    
+
     PERFORMANCE CONSIDERATION:
-    - Scan reads entire table (can be slow/expensive)
-    - OK for prototype with <100 stations
-    - Production would cache this or use pagination
-    
+    - Serial scans block on each 1MB page (N pages = N round-trips)
+    - Parallel segments overlap those round-trips, so latency is
+      roughly the slowest segment rather than the sum of all pages
+
     Returns:
         List of station dictionaries
     """
-    
+
     try:
+        # Serve from cache while it's fresh
+        # WHY MONOTONIC: Immune to wall-clock adjustments in the container
+        with _stations_cache_lock:
+            if time.monotonic() < _stations_cache['expires']:
+                logger.info("Serving stations list from cache")
+                return _stations_cache['items']
+
         logger.info("Scanning DynamoDB for all stations")
-        
-        # Scan the table
-        # WHY SCAN: No specific key, need all items
-        # CAUTION: Scan reads entire table - expensive at scale
-        response = table.scan()
-        
-        items = response.get('Items', [])
-        
-        # Handle pagination if more than 1MB of data
-        # WHY: DynamoDB returns max 1MB per request
-        while 'LastEvaluatedKey' in response:
-            logger.info("Fetching next page of results")
-            response = table.scan(
-                ExclusiveStartKey=response['LastEvaluatedKey']
-            )
-            items.extend(response.get('Items', []))
-        
-        logger.info(f"Retrieved {len(items)} stations")
-        
-        # Convert Decimal to float for JSON
-        return [decimal_to_float(item) for item in items]
-        
+
+        # Scan all segments concurrently
+        # WHY THREADS: Scan is network-bound, so the GIL is released
+        #              while each segment waits on DynamoDB
+        with ThreadPoolExecutor(max_workers=SCAN_SEGMENTS) as executor:
+            segment_results = executor.map(scan_segment, range(SCAN_SEGMENTS))
+
+        # Merge segment results into one list
+        items: List[Dict[str, Any]] = []
+        for segment_items in segment_results:
+            items.extend(segment_items)
+
+        logger.info("Retrieved %d stations", len(items))
+
+        # Refresh the cache for subsequent requests in this container
+        with _stations_cache_lock:
+            _stations_cache['items'] = items
+            _stations_cache['expires'] = time.monotonic() + STATIONS_CACHE_TTL_SECONDS
+
+        # Return raw DynamoDB items
+        # WHY: Decimal conversion now happens inside orjson's serialization
+        #      pass (see json_default) - one walk over the data, not two
+        return items
+
     except Exception as e:
-        logger.error(f"Error scanning table: {str(e)}", exc_info=True)
+        logger.error("Error scanning table: %s", e, exc_info=True)
         raise
 
 
@@ -179,67 +430,132 @@ def get_station_by_id(station_id: str) -> Dict[str, Any]:
     """
     
     try:
-        logger.info(f"Getting station: {station_id}")
+        logger.info("Getting station", extra={'station_id': station_id})
         
         # Get item by partition key
         # WHY GET_ITEM: Fast, consistent read using primary key
         # PERFORMANCE: Typically <10ms
-        response = table.get_item(
-            Key={'station_id': station_id}
+        response = dynamodb_client.get_item(
+            TableName=DYNAMODB_TABLE_NAME,
+            Key={'station_id': {'S': station_id}}
         )
-        
+
         # Check if item exists
         # WHY: GetItem returns empty dict if item not found
         if 'Item' not in response:
-            logger.warning(f"Station not found: {station_id}")
+            logger.warning("Station not found", extra={'station_id': station_id})
             return None
-        
-        # Convert Decimal to float for JSON
-        return decimal_to_float(response['Item'])
+
+        # Unmarshal once here - Decimals are converted during serialization
+        return deserialize_item(response['Item'])
         
     except Exception as e:
         logger.error(
-            f"Error getting station {station_id}: {str(e)}",
+            "Error getting station %s: %s", station_id, e,
             exc_info=True
         )
         raise
 
 
+def get_stations_batch(station_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Retrieve multiple stations in one DynamoDB round-trip
+
+    WHY BATCH_GET_ITEM:
+    - N individual GetItem calls cost N network round-trips
+    - BatchGetItem fetches up to 100 keys per request, so the same N
+      stations cost ceil(N/100) round-trips
+
+    Args:
+        station_ids: Station IDs to fetch (duplicates removed)
+
+    Returns:
+        List of station dictionaries (missing IDs are simply absent)
+    """
+
+    # Deduplicate while preserving order
+    # WHY: DynamoDB rejects batch requests containing duplicate keys
+    unique_ids = list(dict.fromkeys(station_ids))
+
+    items: List[Dict[str, Any]] = []
+    for start in range(0, len(unique_ids), BATCH_GET_MAX_KEYS):
+        chunk = unique_ids[start:start + BATCH_GET_MAX_KEYS]
+
+        request_items = {
+            DYNAMODB_TABLE_NAME: {
+                'Keys': [{'station_id': {'S': station_id}} for station_id in chunk]
+            }
+        }
+
+        # Loop until DynamoDB has answered every key
+        # WHY: BatchGetItem may return UnprocessedKeys under throttling
+        while request_items:
+            response = dynamodb_client.batch_get_item(RequestItems=request_items)
+            items.extend(
+                deserialize_item(item)
+                for item in response.get('Responses', {}).get(DYNAMODB_TABLE_NAME, [])
+            )
+            request_items = response.get('UnprocessedKeys') or {}
+
+    return items
+
+
 def handle_get_stations(event: Dict[str, Any]) -> Dict[str, Any]:
     """
     Handle GET /stations - list all stations
-    
+
     ENDPOINT: GET /stations
-    QUERY PARAMS: None (future: could add filtering, pagination)
-    
+    QUERY PARAMS: ids (optional) - comma-separated station IDs to fetch
+                  via BatchGetItem instead of a full scan
+
     Args:
         event: API Gateway event
-        
+
     Returns:
         API Gateway response with list of stations
     """
-    
+
     try:
-        # Get all stations from DynamoDB
-        stations = get_all_stations()
-        
+        # Targeted lookup: GET /stations?ids=station-01,station-02
+        # WHY: Batching batchable reads is far cheaper than a scan when
+        #      the caller already knows which stations it wants
+        query_params = event.get('queryStringParameters') or {}
+        ids_param = query_params.get('ids')
+
+        if ids_param:
+            station_ids = [s.strip() for s in ids_param.split(',') if s.strip()]
+            if not station_ids:
+                return create_response(
+                    status_code=400,
+                    body={
+                        'error': 'Bad request',
+                        'message': 'ids must be a comma-separated list of station IDs'
+                    },
+                    event=event
+                )
+            stations = get_stations_batch(station_ids)
+        else:
+            # Get all stations from DynamoDB
+            stations = get_all_stations()
+
         # Return success response
+        # WHY BYTES: Serializing per item avoids materializing one giant
+        #   envelope object plus one giant string for large fleets
         return create_response(
             status_code=200,
-            body={
-                'count': len(stations),
-                'stations': stations
-            }
+            body=serialize_stations_body(stations),
+            event=event
         )
         
     except Exception as e:
-        logger.error(f"Error in handle_get_stations: {str(e)}", exc_info=True)
+        logger.error("Error in handle_get_stations: %s", e, exc_info=True)
         return create_response(
             status_code=500,
             body={
                 'error': 'Internal server error',
                 'message': 'Failed to retrieve stations'
-            }
+            },
+            event=event
         )
 
 
@@ -270,7 +586,8 @@ def handle_get_station_by_id(event: Dict[str, Any]) -> Dict[str, Any]:
                 body={
                     'error': 'Bad request',
                     'message': 'station_id is required'
-                }
+                },
+                event=event
             )
         
         # Get station from DynamoDB
@@ -283,18 +600,20 @@ def handle_get_station_by_id(event: Dict[str, Any]) -> Dict[str, Any]:
                 body={
                     'error': 'Not found',
                     'message': f'Station {station_id} not found'
-                }
+                },
+                event=event
             )
         
         # Return station data
         return create_response(
             status_code=200,
-            body={'station': station}
+            body={'station': station},
+            event=event
         )
         
     except Exception as e:
         logger.error(
-            f"Error in handle_get_station_by_id: {str(e)}",
+            "Error in handle_get_station_by_id: %s", e,
             exc_info=True
         )
         return create_response(
@@ -302,7 +621,8 @@ def handle_get_station_by_id(event: Dict[str, Any]) -> Dict[str, Any]:
             body={
                 'error': 'Internal server error',
                 'message': 'Failed to retrieve station'
-            }
+            },
+            event=event
         )
 
 
@@ -324,7 +644,8 @@ def handle_options(event: Dict[str, Any]) -> Dict[str, Any]:
     
     return create_response(
         status_code=200,
-        body={'message': 'CORS preflight response'}
+        body={'message': 'CORS preflight response'},
+        event=event
     )
 
 
@@ -332,6 +653,23 @@ def handle_options(event: Dict[str, Any]) -> Dict[str, Any]:
 # LAMBDA HANDLER (Entry Point)
 # ==============================================================================
 
+# Static route table, built once at import time
+# WHY: Dispatching via one dict lookup replaces the per-request chain of
+#      method/path comparisons; adding an endpoint is one new entry
+ROUTES = {
+    ('OPTIONS', '/stations'): handle_options,
+    ('GET', '/stations'): handle_get_stations,
+}
+
+# Matcher for the parameterized /stations/{station_id} route
+# WHY COMPILED: re caches internally, but compiling at module scope skips
+#   the cache lookup and documents the route shape in one place
+# WHY FULLMATCH + CAPTURE: Rejects malformed paths like /stations/a/b/c
+#   instead of routing them, tolerates a trailing slash, and captures the
+#   station_id so the handler doesn't re-parse the path
+STATION_ID_ROUTE = re.compile(r'/stations/([^/]+)/?')
+
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda function handler for API requests
@@ -353,7 +691,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     # Log request for debugging
     logger.info(
-        f"API request received",
+        "API request received",
         extra={
             'http_method': event.get('httpMethod'),
             'path': event.get('path'),
@@ -365,47 +703,54 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Extract HTTP method and path
         http_method = event.get('httpMethod', '')
         path = event.get('path', '')
-        
+
         # Handle OPTIONS for CORS preflight
-        # WHY: Browsers send this before actual request
+        # WHY: Browsers send this before actual request, for any path
         if http_method == 'OPTIONS':
             return handle_options(event)
-        
-        # Route based on HTTP method and path
+
+        # Exact routes: one dict lookup
         # WHY: Single Lambda can handle multiple endpoints
+        handler = ROUTES.get((http_method, path))
+        if handler:
+            return handler(event)
+
+        # Parameterized route: GET /stations/{station_id}
         if http_method == 'GET':
-            # GET /stations - list all
-            if path == '/stations':
-                return handle_get_stations(event)
-            
-            # GET /stations/{station_id} - get specific
-            elif path.startswith('/stations/'):
+            match = STATION_ID_ROUTE.fullmatch(path)
+            if match:
+                # Inject the captured ID so the handler skips path parsing
+                # WHY SETDEFAULT-STYLE: pathParameters may be None when the
+                #   Lambda is invoked outside API Gateway
+                path_params = event.get('pathParameters') or {}
+                path_params['station_id'] = match.group(1)
+                event['pathParameters'] = path_params
                 return handle_get_station_by_id(event)
-            
-            else:
-                # Unknown path
-                return create_response(
-                    status_code=404,
-                    body={
-                        'error': 'Not found',
-                        'message': f'Path {path} not found'
-                    }
-                )
-        
-        else:
-            # Unsupported HTTP method
+
+            # Unknown path
             return create_response(
-                status_code=405,
+                status_code=404,
                 body={
-                    'error': 'Method not allowed',
-                    'message': f'Method {http_method} not supported'
-                }
+                    'error': 'Not found',
+                    'message': f'Path {path} not found'
+                },
+                event=event
             )
-    
+
+        # Unsupported HTTP method
+        return create_response(
+            status_code=405,
+            body={
+                'error': 'Method not allowed',
+                'message': f'Method {http_method} not supported'
+            },
+            event=event
+        )
+
     except Exception as e:
         # Catch-all error handler
         logger.error(
-            f"Unexpected error in lambda_handler: {str(e)}",
+            "Unexpected error in lambda_handler: %s", e,
             exc_info=True
         )
         
@@ -414,7 +759,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             body={
                 'error': 'Internal server error',
                 'message': 'An unexpected error occurred'
-            }
+            },
+            event=event
         )
 
 
@@ -445,8 +791,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 #     
 #     # Test list endpoint
 #     result = lambda_handler(test_event_list, MockContext())
-#     print("List stations:", json.dumps(result, indent=2))
+#     print("List stations:", orjson.dumps(result).decode())
 #     
 #     # Test single station endpoint
 #     result = lambda_handler(test_event_single, MockContext())
-#     print("Get station:", json.dumps(result, indent=2))
\ No newline at end of file
+#     print("Get station:", orjson.dumps(result).decode())
\ No newline at end of file
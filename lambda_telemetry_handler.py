@@ -29,13 +29,21 @@ EXPECTED INPUT (from IoT Core):
 }
 """
 
-import json
+import atexit
 import boto3
+import fastjsonschema
+import orjson
 import os
 import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from decimal import Decimal
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 
 # ==============================================================================
 # CONFIGURATION
@@ -46,11 +54,63 @@ from decimal import Decimal
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Attribute names present on every LogRecord, captured once
+# WHY: Anything not in this set came in via extra= and belongs in the log
+_LOG_RECORD_DEFAULTS = frozenset(
+    vars(logging.LogRecord('', 0, '', 0, '', (), None))
+) | {'message', 'asctime'}
+
+
+class JsonLogFormatter(logging.Formatter):
+    """
+    Emit one JSON object per log line via orjson
+
+    WHY THIS FORMATTER:
+    - JSON log lines are directly queryable in CloudWatch Logs Insights
+    - orjson serializes the record faster than %-interpolating a format
+      string plus manual field concatenation
+    - Fields passed via extra= (station_id, s3_key, ...) come out as
+      first-class JSON keys instead of being lost
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'level': record.levelname,
+            'message': record.getMessage()
+        }
+        # Lift extra= fields into the entry
+        for key, value in record.__dict__.items():
+            if key not in _LOG_RECORD_DEFAULTS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+# Install on whatever handlers the Lambda runtime pre-configured
+for _handler in logger.handlers:
+    _handler.setFormatter(JsonLogFormatter())
+
+# Shared botocore configuration
+# WHY TCP KEEPALIVE: Keeps the HTTPS connection alive between warm
+#   invocations, avoiding a fresh TLS handshake (~50-100ms) per message
+# WHY TIGHT TIMEOUTS: Both writes normally finish in <100ms; fail fast
+#   and let adaptive retries handle transient throttling
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=5,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
 # Initialize AWS service clients
 # WHY: Reusing clients across invocations improves performance
+# WHY LOW-LEVEL CLIENT: The Table resource wraps every call in pure-Python
+#   dispatch plus per-call serializer construction; the client with one
+#   reused TypeSerializer skips that overhead on every put_item
 # IMPORTANT: Initialize outside handler for Lambda container reuse
-dynamodb = boto3.resource('dynamodb')
-s3_client = boto3.client('s3')
+dynamodb_client = boto3.client('dynamodb', config=BOTO_CONFIG)
+s3_client = boto3.client('s3', config=BOTO_CONFIG)
 
 # Get configuration from environment variables
 # WHY: Makes Lambda configurable without code changes
@@ -58,103 +118,155 @@ DYNAMODB_TABLE_NAME = os.environ['DYNAMODB_TABLE_NAME']
 S3_BUCKET_NAME = os.environ['S3_BUCKET_NAME']
 ENVIRONMENT = os.environ.get('ENVIRONMENT', 'dev')
 
-# Get DynamoDB table reference
-# WHY: Reuse table reference for better performance
-table = dynamodb.Table(DYNAMODB_TABLE_NAME)
+# Teach boto3's TypeSerializer to accept floats
+# WHY: The stock serializer rejects float with a TypeError, which forced a
+#      separate Python walk converting every float to Decimal before each
+#      put_item. Converting inside the serialization pass boto3 already
+#      does means one walk over the item instead of two.
+# WHY repr(): Shortest round-trip representation, same as Decimal(str(v))
+_serializer_is_number = TypeSerializer._is_number
+_serializer_serialize_n = TypeSerializer._serialize_n
+
+
+def _is_number_with_float(self, value: Any) -> bool:
+    if isinstance(value, float):
+        return True
+    return _serializer_is_number(self, value)
+
+
+def _serialize_n_with_float(self, value: Any) -> str:
+    if isinstance(value, float):
+        value = Decimal(repr(value))
+    return _serializer_serialize_n(self, value)
+
+
+TypeSerializer._is_number = _is_number_with_float
+TypeSerializer._serialize_n = _serialize_n_with_float
+
+# Single serializer instance reused for every put_item
+# WHY: Stateless and thread-safe, so one instance serves both writer
+#      threads without per-call construction
+serializer = TypeSerializer()
+
+# Thread pool for issuing the DynamoDB and S3 writes concurrently
+# WHY MODULE SCOPE: Threads are created once per container, not per message
+# WHY 2 WORKERS: Exactly one per independent write (DynamoDB + S3)
+executor = ThreadPoolExecutor(max_workers=2)
+
+# S3 archival batching
+# WHY: One PutObject per message means PUT latency and cost dominate at
+#      fleet scale (100 stations x 1 msg/s = 100 PUTs/s). Buffering
+#      messages in the warm container and flushing one NDJSON object per
+#      batch divides PUT count by the batch size.
+# TRADE-OFF: Up to a batch of messages can be lost if the container dies
+#            before flushing - acceptable for archival (DynamoDB still
+#            holds latest state); atexit flushes on normal shutdown
+S3_BATCH_MAX_MESSAGES = 50      # Flush after this many buffered messages
+S3_BATCH_MAX_AGE_SECONDS = 5.0  # ...or when the oldest message is this old
+
+_s3_buffer: List[bytes] = []     # Buffered NDJSON lines
+_s3_buffer_started = 0.0         # monotonic time of first buffered message
+_s3_buffer_timestamp = None      # Event timestamp of first buffered message
+_s3_buffer_lock = threading.Lock()
+
+# Cached date-partition prefix for S3 keys
+# WHY: The year=/month=/day= fragment only changes at midnight, so
+#      rebuilding it per flush is wasted formatting
+_s3_prefix_cache = {'date': None, 'prefix': ''}
 
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
+if sys.version_info >= (3, 11):
+    def parse_iso8601(value: str) -> datetime:
+        """
+        Parse an ISO-8601 timestamp string
+
+        WHY THIS BRANCH: Python 3.11+ fromisoformat understands the 'Z'
+        suffix natively, so no replacement string is allocated per message
+        """
+        return datetime.fromisoformat(value)
+else:
+    def parse_iso8601(value: str) -> datetime:
+        """
+        Parse an ISO-8601 timestamp string
+
+        WHY THE REPLACE: fromisoformat before 3.11 rejects the 'Z' suffix,
+        so rewrite it to the +00:00 offset form it does accept
+        """
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# Cache for iso_now, keyed by the current millisecond
+# WHY: Bursts of messages inside one tick share the formatted string
+_iso_now_cache = {'ms': 0, 'iso': ''}
+
+
+def iso_now() -> str:
+    """
+    Current UTC time as an ISO-8601 string, cached per millisecond
+
+    WHY THIS FUNCTION:
+    - datetime.utcnow().isoformat() costs ~1us of object construction
+      plus string formatting per call
+    - Messages processed within the same millisecond (common with the
+      batched S3 archival) reuse one formatted string
+
+    Returns:
+        ISO-8601 timestamp string with millisecond granularity
+    """
+
+    ms = time.time_ns() // 1_000_000
+    if ms != _iso_now_cache['ms']:
+        _iso_now_cache['ms'] = ms
+        _iso_now_cache['iso'] = datetime.utcfromtimestamp(ms / 1000).isoformat()
+    return _iso_now_cache['iso']
+
+
+# Telemetry validation schema, compiled once at import time
+# WHY COMPILED: fastjsonschema generates specialized Python code for the
+#   schema, so validation is one function call instead of a Python-level
+#   loop over required fields plus separate isinstance checks per message
+# WHY THESE FIELDS: station_id/battery_available/timestamp are essential
+#   for system operation; everything else is passed through as-is
+validate_telemetry_schema = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['station_id', 'battery_available', 'timestamp'],
+    'properties': {
+        # Consistent naming prevents database issues
+        'station_id': {'type': 'string', 'minLength': 1},
+        # Prevents type errors in database and analytics
+        'battery_available': {'type': 'number', 'minimum': 0},
+        # Ensures time-series data is properly ordered
+        'timestamp': {'type': 'string', 'format': 'date-time'}
+    }
+})
+
+
 def validate_telemetry(data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
     """
     Validate incoming telemetry data structure
-    
+
     WHY THIS FUNCTION:
     - Prevents bad data from corrupting database
     - Returns clear error messages for debugging
     - Fails fast (don't waste time processing invalid data)
-    
+
     Args:
         data: Dictionary containing telemetry data
-        
+
     Returns:
         tuple: (is_valid: bool, error_message: Optional[str])
     """
-    
-    # List of required fields
-    # WHY: These fields are essential for system operation
-    required_fields = [
-        'station_id',
-        'battery_available',
-        'timestamp'
-    ]
-    
-    # Check for missing required fields
-    for field in required_fields:
-        if field not in data:
-            error_msg = f"Missing required field: {field}"
-            logger.error(error_msg)
-            return False, error_msg
-    
-    # Validate station_id format
-    # WHY: Consistent naming prevents database issues
-    station_id = data.get('station_id')
-    if not isinstance(station_id, str) or not station_id.strip():
-        return False, "station_id must be a non-empty string"
-    
-    # Validate battery_available is a number
-    # WHY: Prevents type errors in database and analytics
-    battery_available = data.get('battery_available')
-    if not isinstance(battery_available, (int, float)) or battery_available < 0:
-        return False, "battery_available must be a non-negative number"
-    
-    # Validate timestamp format
-    # WHY: Ensures time-series data is properly ordered
-    try:
-        datetime.fromisoformat(data['timestamp'].replace('Z', '+00:00'))
-    except (ValueError, AttributeError):
-        return False, "timestamp must be valid ISO-8601 format"
-    
-    # All validations passed
-    return True, None
-
 
-def convert_floats_to_decimal(data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Convert float values to Decimal for DynamoDB
-    
-    WHY THIS FUNCTION:
-    - DynamoDB doesn't support Python float type
-    - Must use Decimal for numeric values with decimals
-    - Without this, Lambda would crash on DynamoDB write
-    
-    Args:
-        data: Dictionary potentially containing floats
-        
-    Returns:
-        Dictionary with floats converted to Decimal
-    """
-    
-    converted = {}
-    for key, value in data.items():
-        if isinstance(value, float):
-            # Convert float to Decimal
-            # WHY: DynamoDB requires Decimal for precision
-            converted[key] = Decimal(str(value))
-        elif isinstance(value, dict):
-            # Recursively convert nested dictionaries
-            converted[key] = convert_floats_to_decimal(value)
-        elif isinstance(value, list):
-            # Convert lists of floats
-            converted[key] = [
-                Decimal(str(item)) if isinstance(item, float) else item
-                for item in value
-            ]
-        else:
-            converted[key] = value
-    
-    return converted
+    try:
+        # Single call into the precompiled validator
+        validate_telemetry_schema(data)
+        return True, None
+    except fastjsonschema.JsonSchemaException as e:
+        logger.error("Validation failed: %s", e.message)
+        return False, e.message
 
 
 def store_in_dynamodb(data: Dict[str, Any]) -> bool:
@@ -174,20 +286,31 @@ def store_in_dynamodb(data: Dict[str, Any]) -> bool:
     """
     
     try:
-        # Convert floats to Decimal for DynamoDB
-        data_to_store = convert_floats_to_decimal(data)
-        
+        # Shallow-copy before adding metadata
+        # WHY: The raw event is shared with the concurrent S3 archive
+        #      thread, so it must not be mutated here; floats are handled
+        #      by the patched TypeSerializer during put_item itself
+        data_to_store = dict(data)
+
         # Add metadata
         # WHY: Track when data was processed by Lambda
-        data_to_store['lambda_processed_at'] = datetime.utcnow().isoformat()
+        data_to_store['lambda_processed_at'] = iso_now()
         
+        # Marshal to DynamoDB wire format with the shared serializer
+        # WHY: One explicit pass here replaces the resource layer's
+        #      per-call dispatch and serializer construction
+        item = {
+            key: serializer.serialize(value)
+            for key, value in data_to_store.items()
+        }
+
         # Write to DynamoDB
         # WHY: PutItem creates or replaces item (upsert operation)
         # PERFORMANCE: Typically completes in <10ms
-        response = table.put_item(Item=data_to_store)
+        dynamodb_client.put_item(TableName=DYNAMODB_TABLE_NAME, Item=item)
         
         logger.info(
-            f"Stored state for station {data['station_id']} in DynamoDB",
+            "Stored state in DynamoDB",
             extra={'station_id': data['station_id']}
         )
         
@@ -196,84 +319,161 @@ def store_in_dynamodb(data: Dict[str, Any]) -> bool:
     except Exception as e:
         # Log error but don't crash - we can still save to S3
         logger.error(
-            f"Failed to store in DynamoDB: {str(e)}",
-            extra={'station_id': data.get('station_id'), 'error': str(e)}
+            "Failed to store in DynamoDB: %s", e,
+            extra={'station_id': data.get('station_id')}
         )
         return False
 
 
-def archive_to_s3(data: Dict[str, Any]) -> bool:
+def flush_s3_buffer() -> bool:
     """
-    Archive raw telemetry to S3 for historical analysis
-    
+    Write all buffered telemetry lines to S3 as one NDJSON object
+
     WHY THIS FUNCTION:
-    - S3 is cheap storage for rarely-accessed data
-    - Enables future analytics without overloading DynamoDB
-    - Provides data durability (11 9's - 99.999999999%)
-    
+    - One PutObject per batch instead of per message amortizes the
+      HTTPS request overhead across the whole batch
+    - NDJSON (one JSON object per line) is directly queryable by Athena
+
     OBJECT KEY STRUCTURE:
-    telemetry/year=YYYY/month=MM/day=DD/station-XX_YYYYMMDD_HHMMSS_UUID.json
-    
+    telemetry/year=YYYY/month=MM/day=DD/batch_YYYYMMDD_HHMMSS_UUID.ndjson
+
     WHY THIS STRUCTURE:
     - Partitioned by date for efficient querying (Athena, EMR)
     - Includes timestamp for ordering
-    - UUID prevents collisions if multiple messages same second
-    
-    Args:
-        data: Validated telemetry data
-        
+    - Random suffix prevents collisions if multiple containers flush
+      the same second
+
     Returns:
-        bool: True if successful, False otherwise
+        bool: True if flushed (or nothing to flush), False on failure
     """
-    
+
+    global _s3_buffer, _s3_buffer_started, _s3_buffer_timestamp
+
+    # Atomically take ownership of the current batch
+    # WHY: Another thread may append while we upload
+    with _s3_buffer_lock:
+        if not _s3_buffer:
+            return True
+        batch = _s3_buffer
+        timestamp = _s3_buffer_timestamp
+        _s3_buffer = []
+        _s3_buffer_started = 0.0
+        _s3_buffer_timestamp = None
+
     try:
-        # Parse timestamp from telemetry
-        timestamp = datetime.fromisoformat(
-            data['timestamp'].replace('Z', '+00:00')
-        )
-        
         # Generate S3 key with date partitioning
         # WHY: Partitions make future queries faster and cheaper
-        # EXAMPLE: telemetry/year=2024/month=01/day=15/station-01_20240115_143045_abc.json
-        import uuid
+        # NOTE: Partition comes from the event time of the first message
+        #       in the batch; batches span at most a few seconds
+        batch_date = timestamp.date()
+        if _s3_prefix_cache['date'] != batch_date:
+            _s3_prefix_cache['date'] = batch_date
+            _s3_prefix_cache['prefix'] = (
+                f"telemetry/"
+                f"year={timestamp.year}/"
+                f"month={timestamp.month:02d}/"
+                f"day={timestamp.day:02d}/"
+            )
+
+        # Random suffix prevents collisions if multiple containers flush
+        # the same second
+        # WHY OS.URANDOM: 8 hex chars with the same collision profile as
+        #   uuid4().hex[:8], minus the UUID object construction on top
         s3_key = (
-            f"telemetry/"
-            f"year={timestamp.year}/"
-            f"month={timestamp.month:02d}/"
-            f"day={timestamp.day:02d}/"
-            f"{data['station_id']}_{timestamp.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.json"
+            f"{_s3_prefix_cache['prefix']}"
+            f"batch_{timestamp.strftime('%Y%m%d_%H%M%S')}_{os.urandom(4).hex()}.ndjson"
         )
-        
-        # Convert to JSON string
-        # WHY: S3 stores bytes, need to serialize Python dict
-        json_data = json.dumps(data, indent=2, default=str)
-        
+
         # Upload to S3
-        # PERFORMANCE: Typically completes in <100ms for small objects
+        # PERFORMANCE: One PUT per batch instead of one per message
         s3_client.put_object(
             Bucket=S3_BUCKET_NAME,
             Key=s3_key,
-            Body=json_data,
-            ContentType='application/json',
+            Body=b''.join(batch),
+            ContentType='application/x-ndjson',
             # Metadata for object tagging
             Metadata={
-                'station_id': data['station_id'],
-                'ingestion_time': datetime.utcnow().isoformat()
+                'message_count': str(len(batch)),
+                'ingestion_time': iso_now()
             }
         )
-        
+
         logger.info(
-            f"Archived to S3: {s3_key}",
-            extra={'station_id': data['station_id'], 's3_key': s3_key}
+            "Archived batch to S3",
+            extra={'s3_key': s3_key, 'message_count': len(batch)}
         )
-        
+
         return True
-        
+
     except Exception as e:
         # Log error and continue - S3 failure shouldn't stop DynamoDB write
         logger.error(
-            f"Failed to archive to S3: {str(e)}",
-            extra={'station_id': data.get('station_id'), 'error': str(e)}
+            "Failed to archive batch to S3: %s", e,
+            extra={'message_count': len(batch)}
+        )
+        return False
+
+
+# Flush any buffered messages when the container shuts down
+# WHY: Lambda freezes/kills containers; atexit covers graceful shutdown
+atexit.register(flush_s3_buffer)
+
+
+def archive_to_s3(data: Dict[str, Any]) -> bool:
+    """
+    Buffer telemetry for batched archival to S3
+
+    WHY THIS FUNCTION:
+    - S3 is cheap storage for rarely-accessed data
+    - Enables future analytics without overloading DynamoDB
+    - Buffering across warm invocations turns N PUTs into N/50
+
+    FLUSH POLICY:
+    - Batch reaches S3_BATCH_MAX_MESSAGES, or
+    - Oldest buffered message is older than S3_BATCH_MAX_AGE_SECONDS
+
+    Args:
+        data: Validated telemetry data
+
+    Returns:
+        bool: True if buffered/flushed successfully, False otherwise
+    """
+
+    global _s3_buffer_started, _s3_buffer_timestamp
+
+    try:
+        # Parse timestamp from telemetry
+        timestamp = parse_iso8601(data['timestamp'])
+
+        # Serialize one compact NDJSON line
+        # WHY ORJSON: Emits compact bytes directly (no str->bytes encode)
+        #             and is 5-6x faster than stdlib json; no pretty-print
+        #             whitespace bloating S3 storage and PUT payloads
+        line = orjson.dumps(data, default=str) + b'\n'
+
+        # Append to the in-memory batch
+        with _s3_buffer_lock:
+            if not _s3_buffer:
+                _s3_buffer_started = time.monotonic()
+                _s3_buffer_timestamp = timestamp
+            _s3_buffer.append(line)
+
+            should_flush = (
+                len(_s3_buffer) >= S3_BATCH_MAX_MESSAGES
+                or time.monotonic() - _s3_buffer_started >= S3_BATCH_MAX_AGE_SECONDS
+            )
+
+        # Flush outside the lock so appends aren't blocked on the upload
+        if should_flush:
+            return flush_s3_buffer()
+
+        return True
+
+    except Exception as e:
+        # Log error and continue - S3 failure shouldn't stop DynamoDB write
+        logger.error(
+            "Failed to archive to S3: %s", e,
+            extra={'station_id': data.get('station_id')}
         )
         return False
 
@@ -304,7 +504,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     # Log the incoming event for debugging
     # WHY: Helps troubleshoot issues in CloudWatch Logs
     logger.info(
-        f"Processing telemetry event",
+        "Processing telemetry event",
         extra={
             'request_id': context.request_id,
             'function_name': context.function_name,
@@ -318,25 +518,27 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         is_valid, error_message = validate_telemetry(event)
         
         if not is_valid:
-            logger.error(f"Validation failed: {error_message}")
+            logger.error("Validation failed: %s", error_message)
             return {
                 'statusCode': 400,
-                'body': json.dumps({
+                'body': orjson.dumps({
                     'error': 'Validation failed',
                     'message': error_message
-                })
+                }).decode()
             }
         
         station_id = event['station_id']
-        logger.info(f"Processing telemetry for station: {station_id}")
-        
-        # STEP 2: Store in DynamoDB (latest state)
-        # WHY: DynamoDB first for fast API queries
-        dynamodb_success = store_in_dynamodb(event)
+        logger.info("Processing telemetry for station", extra={'station_id': station_id})
         
-        # STEP 3: Archive to S3 (historical data)
-        # WHY: S3 for cheap long-term storage and analytics
-        s3_success = archive_to_s3(event)
+        # STEP 2 + 3: Store in DynamoDB and archive to S3 concurrently
+        # WHY: The two writes are independent, so running them in parallel
+        #      means the message pays max(DynamoDB, S3) latency, not the sum
+        # SAFETY: boto3 clients are thread-safe, so sharing the module-level
+        #         table and s3_client across the two threads is fine
+        dynamodb_future = executor.submit(store_in_dynamodb, event)
+        s3_future = executor.submit(archive_to_s3, event)
+        dynamodb_success = dynamodb_future.result()
+        s3_success = s3_future.result()
         
         # STEP 4: Determine overall success
         # LOGIC: Both operations should succeed, but partial success is OK
@@ -347,41 +549,43 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             status_code = 207  # Multi-Status (partial success)
             message = "Telemetry partially processed"
             logger.warning(
-                f"Partial success for {station_id}: "
-                f"DynamoDB={dynamodb_success}, S3={s3_success}"
+                "Partial success: DynamoDB=%s, S3=%s",
+                dynamodb_success, s3_success,
+                extra={'station_id': station_id}
             )
         else:
             status_code = 500
             message = "Failed to process telemetry"
-            logger.error(f"Complete failure for {station_id}")
+            logger.error("Complete failure", extra={'station_id': station_id})
         
         # STEP 5: Return response
         # NOTE: IoT Core doesn't use this response, but useful for testing
+        # WHY ORJSON: C-extension serializer, 5-6x faster than stdlib json
         return {
             'statusCode': status_code,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'message': message,
                 'station_id': station_id,
                 'dynamodb_success': dynamodb_success,
                 's3_success': s3_success,
-                'timestamp': datetime.utcnow().isoformat()
-            })
+                'timestamp': iso_now()
+            }).decode()
         }
     
     except Exception as e:
         # Catch-all error handler
         # WHY: Ensures Lambda doesn't crash silently
         logger.error(
-            f"Unexpected error in lambda_handler: {str(e)}",
+            "Unexpected error in lambda_handler: %s", e,
             exc_info=True  # Includes full stack trace
         )
         
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': 'Internal server error',
                 'message': str(e)
-            })
+            }).decode()
         }
 
 
@@ -410,4 +614,4 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 #     
 #     # Call handler
 #     result = lambda_handler(test_event, MockContext())
-#     print(json.dumps(result, indent=2))
\ No newline at end of file
+#     print(orjson.dumps(result).decode())
\ No newline at end of file
@@ -28,14 +28,16 @@ REQUIREMENTS:
 - MQTT client library installed
 """
 
-import json
+import asyncio
+import multiprocessing
+import os
 import time
-import random
 import argparse
 import logging
-from datetime import datetime
+from concurrent.futures import Future
+from datetime import datetime, timezone
 from typing import Dict, Any, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import sys
 
 # Try to import AWS IoT SDK
@@ -48,6 +50,36 @@ except ImportError:
     print("Install with: pip install awsiotsdk")
     sys.exit(1)
 
+# Try to import NumPy
+# WHY: Station state lives in arrays so one vectorized call updates the
+#      whole fleet per cycle instead of N Python-level loops
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: NumPy not installed")
+    print("Install with: pip install numpy")
+    sys.exit(1)
+
+# Try to import msgpack (optional)
+# WHY: Binary telemetry encoding is ~40-50% smaller than JSON on this
+#      schema, which buys headroom under the broker's per-connection
+#      throughput cap; only needed when --encoding msgpack is used
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Try to import Numba (optional)
+# WHY: JIT-compiles the fleet update to a parallel SIMD loop - worth it
+#      for fleets in the tens of thousands; the NumPy path is plenty
+#      below that, so missing Numba is not an error
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # ==============================================================================
 # CONFIGURATION
 # ==============================================================================
@@ -71,20 +103,167 @@ IOT_CA_PATH = "../certs/AmazonRootCA1.pem"    # Path to Amazon root CA
 # WHY: Matches IoT Rule filter in Terraform
 TOPIC_PREFIX = "ev/station"
 
+# Maximum unacknowledged publishes in flight
+# WHY: AWS IoT Core caps a connection at 100 unacked QoS 1 publishes;
+#      staying under it avoids broker-side queueing and disconnects
+MAX_INFLIGHT_PUBLISHES = 100
+
+# Fleet-level topic for batched telemetry
+# WHY: One PUBLISH/PUBACK pair for the whole fleet instead of one per
+#      station cuts MQTT/TLS framing overhead and broker load by ~N x
+# NOTE: The shipped IoT Rule and Lambda handle one JSON object per
+#       message, so batching is opt-in (--batch); enable it only with a
+#       downstream that fans the JSON array out (or accepts arrays)
+FLEET_TOPIC = f"{TOPIC_PREFIX}/fleet/telemetry"
+
+# AWS IoT Core payload size limit
+# WHY: Publishes above 128 KB are rejected; batches are chunked to fit
+IOT_MAX_PAYLOAD_BYTES = 128 * 1024
+
+# Simulation event probabilities (per station per cycle)
+# WHY MODULE CONSTANTS: All randomness is drawn as one (5, N) block per
+#      cycle and compared against these thresholds with vectorized
+#      masks; naming them keeps the two update kernels (NumPy and
+#      Numba) in lockstep and tunable in one place
+P_CHARGE_DONE = 0.2    # A charging battery finishes
+P_SWAP = 0.15          # A customer performs a battery swap
+P_ENTER_MAINTENANCE = 0.01   # operational -> maintenance
+P_EXIT_MAINTENANCE = 0.10    # maintenance -> operational
+
+# Client-side publish pacing
+# WHY: AWS IoT throttles around 100 publishes/s per connection; pacing
+#      slightly below that stops the SDK from entering an endless
+#      disconnect-and-retry storm that wastes CPU and bandwidth
+PUBLISH_RATE_PER_SECOND = 90
+PUBLISH_BURST = 100
+
+
+class TokenBucket:
+    """
+    Simple token-bucket rate limiter for publish pacing
+
+    WHY CLIENT-SIDE LIMITING:
+    - Exceeding the broker's per-connection caps doesn't fail fast - it
+      disconnects the client, which then retries QoS 1 messages forever
+    - Pacing below the cap keeps the connection healthy under any
+      num_stations x interval combination
+
+    HOW IT WORKS:
+    - Tokens refill continuously at `rate` per second up to `burst`
+    - acquire() takes one token, sleeping just long enough when empty
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Sustained tokens (publishes) per second
+            burst: Maximum tokens accumulated while idle
+        """
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return
+            # Sleep exactly until the next token accrues
+            time.sleep((1.0 - self.tokens) / self.rate)
+
+
+def iso_now() -> str:
+    """
+    Current UTC time as an ISO-8601 string with a Z suffix
+
+    WHY A HELPER:
+    - Formatting a timestamp (tzinfo handling + string building) is
+      surprisingly expensive, so callers compute it ONCE per cycle and
+      share it instead of once per station
+    - datetime.now(timezone.utc) is used over the deprecated (and
+      slower on 3.12+) datetime.utcnow()
+    """
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+# ==============================================================================
+# JIT KERNEL (optional)
+# ==============================================================================
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _update_fleet_kernel(temperature, humidity, battery_available,
+                             battery_charging, total_swaps, operational,
+                             draws, swapped_out):
+        """
+        Apply all five simulation sub-steps to every station in parallel
+
+        WHY ONE FUSED KERNEL:
+        - The NumPy path makes ~10 array passes per cycle; this loop
+          touches each station once, compiled to SIMD machine code with
+          the iterations split across cores by prange
+        - Semantics match the NumPy path exactly (same draw rows, same
+          thresholds and bounds)
+
+        NOTE: Mutates the state arrays in place; swapped_out reports
+        which stations performed a swap so the caller can update
+        last_swap_time (strings can't live inside an njit kernel).
+        """
+        n = temperature.shape[0]
+        for i in prange(n):
+            # Batteries charging: a charging battery finishes
+            if battery_charging[i] > 0 and draws[0, i] < P_CHARGE_DONE:
+                battery_charging[i] -= 1
+                battery_available[i] += 1
+
+            # Battery swaps
+            swapped = battery_available[i] > 0 and draws[1, i] < P_SWAP
+            swapped_out[i] = swapped
+            if swapped:
+                battery_available[i] -= 1
+                battery_charging[i] += 1
+                total_swaps[i] += 1
+
+            # Temperature: bounded random walk (±0.5°C, clamped 15-35°C)
+            t = temperature[i] + (draws[2, i] - 0.5)
+            temperature[i] = 15.0 if t < 15.0 else (35.0 if t > 35.0 else t)
+
+            # Humidity: bounded random walk (±2%, clamped 20-80%)
+            h = humidity[i] + (draws[3, i] * 4.0 - 2.0)
+            humidity[i] = 20.0 if h < 20.0 else (80.0 if h > 80.0 else h)
+
+            # Status flips: enter or leave maintenance mode
+            if operational[i]:
+                if draws[4, i] < P_ENTER_MAINTENANCE:
+                    operational[i] = False
+            elif draws[4, i] < P_EXIT_MAINTENANCE:
+                operational[i] = True
+
+
 # ==============================================================================
 # DATA MODELS
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class StationState:
     """
     Represents the current state of a battery swap station
-    
+
     WHY DATACLASS:
     - Clean, type-safe data structure
     - Auto-generates __init__, __repr__, etc.
-    - Easy conversion to/from dictionaries
-    
+    - slots=True halves per-instance memory and speeds attribute access
+
+    NOTE: The publish hot path works on plain dicts straight from
+    StationFleet.get_telemetry(); this class documents the telemetry
+    schema and serves typed external callers.
+
     FIELDS EXPLAINED:
     - station_id: Unique identifier (e.g., "station-01")
     - battery_available: Batteries ready for swapping
@@ -106,156 +285,305 @@ class StationState:
     last_swap_time: str
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization
+
+        WHY A DICT LITERAL: dataclasses.asdict does a recursive
+        deepcopy-style walk - overkill (and ~10x slower) for a flat
+        struct of eight scalar fields
+        """
+        return {
+            'station_id': self.station_id,
+            'battery_available': self.battery_available,
+            'battery_charging': self.battery_charging,
+            'temperature': self.temperature,
+            'humidity': self.humidity,
+            'status': self.status,
+            'total_swaps_today': self.total_swaps_today,
+            'last_swap_time': self.last_swap_time
+        }
+
+
+# Typed transport layout for one station's telemetry
+# WHY: A structured dtype gives the whole fleet's snapshot one
+#      contiguous, preallocated block - no per-station objects and no
+#      GC pressure - ready for binary serialization
+# NOTE: Fixed-width byte fields keep rows constant-size; iso_now()
+#       emits 27 characters (%Y-%m-%dT%H:%M:%S.%fZ) and NumPy silently
+#       truncates on assignment, so S32 leaves headroom
+TELEM_DTYPE = np.dtype([
+    ('station_id', 'S16'),
+    ('battery_available', 'i4'),
+    ('battery_charging', 'i4'),
+    ('temperature', 'f4'),
+    ('humidity', 'f4'),
+    ('operational', '?'),
+    ('total_swaps_today', 'i4'),
+    ('last_swap_time', 'S32'),
+])
 
 
-class BatterySwapStation:
+# Telemetry payload template (station_id is baked in per station)
+# WHY: The schema is fixed, so payloads can be rendered with one
+#      C-level %-format per station instead of building a dict and
+#      running a generic JSON encoder per message
+# NOTE: %% escapes survive the first interpolation as live specifiers
+PAYLOAD_TEMPLATE = (
+    '{"station_id":"%s","battery_available":%%d,"battery_charging":%%d,'
+    '"temperature":%%.1f,"humidity":%%.1f,"status":"%%s",'
+    '"total_swaps_today":%%d,"last_swap_time":"%%s","timestamp":"%%s"}'
+)
+
+
+class StationFleet:
     """
-    Simulates a single battery swap station's behavior
-    
-    WHY THIS CLASS:
-    - Encapsulates station logic and state
-    - Simulates realistic operational patterns
-    - Makes code modular and testable
-    
-    SIMULATION LOGIC:
+    Simulates the whole fleet of battery swap stations at once
+
+    WHY STRUCTURE-OF-ARRAYS (SoA):
+    - The old design held one Python object per station and looped over
+      them, paying interpreter overhead and five random.* calls per
+      station per cycle
+    - Here each field is a NumPy array of length N, so one vectorized
+      RNG draw + np.clip updates every station in a single C-level pass
+      (orders of magnitude faster once N reaches the hundreds)
+
+    SIMULATION LOGIC (unchanged from the per-object version):
     - Batteries slowly charge over time
     - Random battery swaps occur
-    - Temperature fluctuates realistically
-    - Status can change to maintenance mode
+    - Temperature/humidity follow bounded random walks
+    - Stations occasionally flip into maintenance mode
     """
-    
-    def __init__(self, station_id: str):
+
+    def __init__(self, num_stations: int, seed: int = None, id_offset: int = 0):
         """
-        Initialize a new station simulator
-        
+        Initialize fleet state arrays
+
         Args:
-            station_id: Unique identifier for this station
+            num_stations: Number of stations to simulate
+            seed: Optional RNG seed for reproducible runs
+            id_offset: First station number minus one (used when the
+                       fleet is partitioned across worker processes so
+                       station IDs stay globally unique)
+
+        WHY default_rng: PCG64 is much cheaper per sample than the
+        stdlib's Mersenne Twister, and one generator call can fill a
+        whole block of draws at once (see update()).
         """
-        self.station_id = station_id
-        
+        self.N = num_stations
+        self.rng = np.random.default_rng(seed)
+
+        # Station identifiers (station-01, station-02, ...)
+        self.station_ids = [
+            f"station-{i:02d}"
+            for i in range(id_offset + 1, id_offset + num_stations + 1)
+        ]
+
+        # Preallocate the transport snapshot buffer
+        # WHY: Reused every cycle (fields overwritten in place), so
+        #   snapshotting the fleet allocates nothing after init
+        self.telemetry_buf = np.zeros(self.N, dtype=TELEM_DTYPE)
+        self.telemetry_buf['station_id'] = self.station_ids
+
+        # Prebuild per-station payload templates
+        # WHY: Baking the (internally generated, JSON-safe) station_id
+        #   in at init leaves only the varying fields to format per
+        #   publish; see render_payloads
+        self.payload_templates = [
+            (PAYLOAD_TEMPLATE % station_id).encode()
+            for station_id in self.station_ids
+        ]
+
         # Initialize battery counts
         # WHY THESE VALUES: Realistic for a small station
-        self.battery_available = random.randint(8, 15)  # 8-15 ready batteries
-        self.battery_charging = random.randint(2, 6)    # 2-6 charging
-        
+        self.battery_available = self.rng.integers(8, 16, self.N)  # 8-15 ready
+        self.battery_charging = self.rng.integers(2, 7, self.N)    # 2-6 charging
+
         # Initialize environmental sensors
         # WHY THESE RANGES: Typical indoor environment
-        self.temperature = random.uniform(20.0, 30.0)   # 20-30°C
-        self.humidity = random.uniform(30.0, 60.0)      # 30-60% RH
-        
+        self.temperature = self.rng.uniform(20.0, 30.0, self.N)    # 20-30°C
+        self.humidity = self.rng.uniform(30.0, 60.0, self.N)       # 30-60% RH
+
         # Initialize operational state
-        self.status = "operational"
-        self.total_swaps_today = random.randint(0, 50)  # Historical count
-        self.last_swap_time = datetime.utcnow().isoformat() + "Z"
-        
-        logger.info(f"Initialized {station_id} with {self.battery_available} available batteries")
-    
-    def simulate_battery_charging(self):
-        """
-        Simulate batteries charging over time
-        
-        LOGIC:
-        - 20% chance a charging battery finishes
-        - Moves from charging to available
-        - Realistic: batteries take time to charge
-        """
-        if self.battery_charging > 0 and random.random() < 0.2:  # 20% chance
-            self.battery_charging -= 1
-            self.battery_available += 1
-            logger.debug(f"{self.station_id}: Battery finished charging")
-    
-    def simulate_battery_swap(self):
+        # WHY BOOLEAN: status is binary (operational/maintenance), and a
+        #   bool mask composes directly with the vectorized event draws
+        self.operational = np.ones(self.N, dtype=bool)
+        self.total_swaps_today = self.rng.integers(0, 51, self.N)  # Historical
+        now = iso_now()
+        self.last_swap_time = [now] * self.N
+
+        logger.info("Initialized fleet of %d stations", num_stations)
+
+    def update(self, now_iso: str):
         """
-        Simulate a customer performing a battery swap
-        
-        LOGIC:
-        - 15% chance per update cycle
-        - Takes available battery, puts depleted one in charging
-        - Updates counters and timestamp
-        
-        WHY 15%: Creates realistic but noticeable activity
-        """
-        if self.battery_available > 0 and random.random() < 0.15:  # 15% chance
-            self.battery_available -= 1
-            self.battery_charging += 1
-            self.total_swaps_today += 1
-            self.last_swap_time = datetime.utcnow().isoformat() + "Z"
-            logger.info(f"{self.station_id}: Battery swap performed (total today: {self.total_swaps_today})")
-    
-    def simulate_temperature_change(self):
+        Run all simulation updates for one time step, fleet-wide
+
+        Args:
+            now_iso: Cycle timestamp, computed once by the caller and
+                     shared across all stations
+
+        WHY TWO PATHS: The fused Numba kernel is used when available
+        (one parallel SIMD pass per cycle); otherwise the NumPy
+        mask-based path below runs. Both consume the same (5, N) draw
+        block and produce identical state transitions.
         """
-        Simulate gradual temperature changes
-        
-        LOGIC:
-        - Small random walk (±0.5°C)
-        - Bounded between 15-35°C
-        - Mimics natural fluctuations
-        
-        WHY: Realistic sensor data shows gradual changes, not jumps
+        # Pre-draw ALL randomness for the cycle in one generator call
+        # WHY: One (5, N) block costs a single Python->C transition
+        #   instead of five; the rows feed the five sub-steps
+        draws = self.rng.random((5, self.N))
+
+        if NUMBA_AVAILABLE:
+            swapped = np.empty(self.N, dtype=np.bool_)
+            _update_fleet_kernel(
+                self.temperature, self.humidity, self.battery_available,
+                self.battery_charging, self.total_swaps_today,
+                self.operational, draws, swapped
+            )
+        else:
+            swapped = self._update_vectorized(draws)
+
+        # Quantize environment readings to telemetry resolution
+        # WHY HERE: One vectorized np.round per field per cycle replaces
+        #   2N Python-level round() calls in the serialization paths;
+        #   telemetry only ever reports one decimal anyway
+        np.round(self.temperature, 1, out=self.temperature)
+        np.round(self.humidity, 1, out=self.humidity)
+
+        # Swap timestamps are Python strings, so they update outside
+        # both kernels
+        if swapped.any():
+            for i in np.nonzero(swapped)[0]:
+                self.last_swap_time[i] = now_iso
+            logger.debug("%d battery swaps this cycle", int(swapped.sum()))
+
+    def _update_vectorized(self, draws: np.ndarray) -> np.ndarray:
         """
-        change = random.uniform(-0.5, 0.5)
-        self.temperature = max(15.0, min(35.0, self.temperature + change))
-    
-    def simulate_humidity_change(self):
+        NumPy fallback update (used when Numba is not installed)
+
+        Args:
+            draws: (5, N) block of uniforms in [0, 1)
+
+        Returns:
+            Boolean mask of stations that performed a swap this cycle
+
+        WHY MASKS: Each event ("battery finished charging", "customer
+        swapped") is a boolean array; arithmetic with the mask applies
+        the event to exactly the stations where it fired, with no loop.
         """
-        Simulate gradual humidity changes
-        
-        LOGIC:
-        - Small random walk (±2%)
-        - Bounded between 20-80%
-        - Correlates loosely with temperature
+        # Batteries charging: a charging battery finishes, moving from
+        # charging to available
+        charge_done = (self.battery_charging > 0) & (draws[0] < P_CHARGE_DONE)
+        self.battery_charging -= charge_done
+        self.battery_available += charge_done
+
+        # Battery swaps: a customer takes an available battery and
+        # leaves a depleted one charging
+        swapped = (self.battery_available > 0) & (draws[1] < P_SWAP)
+        self.battery_available -= swapped
+        self.battery_charging += swapped
+        self.total_swaps_today += swapped
+
+        # Temperature: bounded random walk (±0.5°C, clamped 15-35°C)
+        # NOTE: draws are in [0, 1), so (x - 0.5) rescales to ±0.5
+        self.temperature = np.clip(
+            self.temperature + (draws[2] - 0.5), 15.0, 35.0
+        )
+
+        # Humidity: bounded random walk (±2%, clamped 20-80%)
+        self.humidity = np.clip(
+            self.humidity + (draws[3] * 4.0 - 2.0), 20.0, 80.0
+        )
+
+        # Status flips: one draw row serves both directions since a
+        # station is in exactly one state at a time
+        flips = (
+            (self.operational & (draws[4] < P_ENTER_MAINTENANCE))
+            | (~self.operational & (draws[4] < P_EXIT_MAINTENANCE))
+        )
+        self.operational ^= flips
+
+        return swapped
+
+    def get_telemetry(self) -> List[Dict[str, Any]]:
         """
-        change = random.uniform(-2.0, 2.0)
-        self.humidity = max(20.0, min(80.0, self.humidity + change))
-    
-    def simulate_status_change(self):
+        Materialize per-station telemetry rows from the fleet arrays
+
+        Returns:
+            List of telemetry dicts (StationState schema), one per station
+
+        WHY DICTS, NOT StationState: The rows exist only to be
+        serialized; building dataclass instances just to convert them
+        back to dicts would add an allocation + copy per station per
+        cycle. NumPy scalars are converted to native Python types so
+        the rows serialize cleanly.
         """
-        Occasionally switch to maintenance mode
-        
-        LOGIC:
-        - 1% chance to enter maintenance
-        - 10% chance to exit maintenance
-        
-        WHY: Simulates real-world station downtime
-        """
-        if self.status == "operational" and random.random() < 0.01:  # 1% chance
-            self.status = "maintenance"
-            logger.warning(f"{self.station_id}: Entering maintenance mode")
-        elif self.status == "maintenance" and random.random() < 0.10:  # 10% chance
-            self.status = "operational"
-            logger.info(f"{self.station_id}: Exiting maintenance mode")
-    
-    def update(self):
+        return [
+            {
+                'station_id': self.station_ids[i],
+                'battery_available': int(self.battery_available[i]),
+                'battery_charging': int(self.battery_charging[i]),
+                # Already quantized to one decimal during update()
+                'temperature': float(self.temperature[i]),
+                'humidity': float(self.humidity[i]),
+                'status': "operational" if self.operational[i] else "maintenance",
+                'total_swaps_today': int(self.total_swaps_today[i]),
+                'last_swap_time': self.last_swap_time[i]
+            }
+            for i in range(self.N)
+        ]
+
+    def snapshot(self) -> np.ndarray:
         """
-        Run all simulation updates for one time step
-        
-        WHY: Centralizes all state changes in one method
+        Copy current fleet state into the preallocated transport buffer
+
+        Returns:
+            The (reused) structured array of TELEM_DTYPE rows
+
+        WHY: Binary encoders work best from one typed, contiguous
+        block; each field copies with a single vectorized assignment
+        and the buffer itself is allocated once at init. Callers must
+        consume or copy the rows before the next cycle overwrites them.
         """
-        self.simulate_battery_charging()
-        self.simulate_battery_swap()
-        self.simulate_temperature_change()
-        self.simulate_humidity_change()
-        self.simulate_status_change()
-    
-    def get_telemetry(self) -> StationState:
+        buf = self.telemetry_buf
+        buf['battery_available'] = self.battery_available
+        buf['battery_charging'] = self.battery_charging
+        buf['temperature'] = self.temperature
+        buf['humidity'] = self.humidity
+        buf['operational'] = self.operational
+        buf['total_swaps_today'] = self.total_swaps_today
+        buf['last_swap_time'] = self.last_swap_time
+        return buf
+
+    def render_payloads(self, now_iso: str) -> List[bytes]:
         """
-        Get current state as telemetry message
-        
+        Render ready-to-publish JSON payload bytes for every station
+
+        Args:
+            now_iso: Cycle timestamp shared across all stations
+
         Returns:
-            StationState object with current values
-        """
-        return StationState(
-            station_id=self.station_id,
-            battery_available=self.battery_available,
-            battery_charging=self.battery_charging,
-            temperature=round(self.temperature, 1),
-            humidity=round(self.humidity, 1),
-            status=self.status,
-            total_swaps_today=self.total_swaps_today,
-            last_swap_time=self.last_swap_time
-        )
+            List of payload bytes, index-aligned with station_ids
+
+        WHY TEMPLATES OVER A JSON ENCODER:
+        - The schema never changes, so each payload is one C-level
+          %-format into a prebuilt bytes template - no dict build, no
+          generic encoder walk per message
+        - Safe because every interpolated field is numeric, a fixed
+          enum value, or an internally generated timestamp
+        """
+        now_bytes = now_iso.encode()
+        return [
+            self.payload_templates[i] % (
+                int(self.battery_available[i]),
+                int(self.battery_charging[i]),
+                float(self.temperature[i]),
+                float(self.humidity[i]),
+                b"operational" if self.operational[i] else b"maintenance",
+                int(self.total_swaps_today[i]),
+                self.last_swap_time[i].encode(),
+                now_bytes
+            )
+            for i in range(self.N)
+        ]
 
 
 # ==============================================================================
@@ -274,29 +602,96 @@ class IoTSimulator:
     MQTT CONCEPTS:
     - Connection: Persistent TCP connection to IoT broker
     - Topic: Named channel for messages (like "ev/station/01/telemetry")
-    - QoS 1: "At least once delivery" guarantee
+    - QoS 0: "At most once" - fire and forget, no ack round-trip
+    - QoS 1: "At least once" - broker acknowledges every publish
+
+    QoS TRADE-OFF:
+    - Each QoS step up adds broker bookkeeping and an ack round-trip per
+      message, so QoS 1 costs latency and is subject to AWS IoT's
+      100-unacked-publish cap per connection
+    - Telemetry is periodic and lossy-tolerant (the next cycle supersedes
+      a dropped reading), so QoS 0 is the default; use --qos 1 when
+      delivery matters more than throughput
     """
-    
-    def __init__(self, num_stations: int, interval: int):
+
+    def __init__(
+        self,
+        num_stations: int,
+        interval: int,
+        batch: bool = False,
+        qos: mqtt.QoS = mqtt.QoS.AT_MOST_ONCE,
+        seed: int = None,
+        id_offset: int = 0,
+        client_id: str = None,
+        encoding: str = 'json'
+    ):
         """
         Initialize IoT simulator
-        
+
         Args:
             num_stations: Number of stations to simulate
             interval: Seconds between telemetry updates
+            batch: Publish one fleet-level batch per cycle instead of one
+                   message per station (default False - far less framing
+                   overhead, but the shipped IoT Rule and Lambda only
+                   handle per-station objects, so this needs an
+                   array-aware downstream)
+            qos: MQTT quality of service (default AT_MOST_ONCE - no ack
+                 round-trip; see class docstring for the trade-off)
+            seed: Optional RNG seed for reproducible simulation runs
+            id_offset: First station number minus one (for partitioned
+                       multi-process runs; see run_partition)
+            client_id: Explicit MQTT client ID; must be unique per
+                       connection or AWS IoT disconnects the older one
+            encoding: Telemetry wire encoding, 'json' (default) or
+                      'msgpack'. JSON stays the default because the
+                      shipped IoT Rule and Lambda parse JSON; msgpack
+                      needs a binary-aware downstream.
         """
         self.num_stations = num_stations
         self.interval = interval
-        self.stations: List[BatterySwapStation] = []
+        self.batch = batch
+        self.qos = qos
         self.mqtt_connection = None
-        
-        # Create simulated stations
-        # WHY: Each station is independent with own state
-        for i in range(1, num_stations + 1):
-            station_id = f"station-{i:02d}"  # station-01, station-02, etc.
-            self.stations.append(BatterySwapStation(station_id))
-        
-        logger.info(f"Created {num_stations} simulated stations")
+
+        # Telemetry wire encoding
+        # WHY FAIL FAST: A missing optional dependency should surface at
+        #   startup, not as a publish-time crash every cycle
+        if encoding == 'msgpack' and not MSGPACK_AVAILABLE:
+            raise RuntimeError(
+                "msgpack encoding requested but msgpack is not installed "
+                "(pip install msgpack)"
+            )
+        self.encoding = encoding
+
+        # Stable default client ID
+        # WHY: A time-derived ID makes every restart look like a brand
+        #   new client, orphaning any session state on the broker;
+        #   partition workers pass their own unique IDs explicitly
+        self.client_id = client_id or "station-simulator"
+
+        # Pace publishes below the broker's per-connection throttle
+        # WHY: See TokenBucket - an over-rate client gets disconnected,
+        #   which is far more expensive than briefly waiting for a token
+        self.rate_limiter = TokenBucket(
+            rate=PUBLISH_RATE_PER_SECOND, burst=PUBLISH_BURST
+        )
+
+        # Create the simulated fleet
+        # WHY ONE OBJECT: State lives in per-field arrays so each cycle
+        #   updates every station with a handful of vectorized calls
+        self.fleet = StationFleet(num_stations, seed=seed, id_offset=id_offset)
+
+        # Precompute per-station topic strings
+        # WHY: Rebuilding the f-string on every publish costs N string
+        #   allocations per cycle forever; the topics never change
+        # WHY BYTES: Skips the UTF-8 encode inside the SDK publish path
+        self.topics = {
+            station_id: f"{TOPIC_PREFIX}/{station_id}/telemetry".encode()
+            for station_id in self.fleet.station_ids
+        }
+
+        logger.info("Created %d simulated stations", num_stations)
     
     def connect_to_iot(self):
         """
@@ -310,7 +705,7 @@ class IoTSimulator:
         - AWS verifies certificate on connect
         """
         try:
-            logger.info(f"Connecting to AWS IoT Core at {IOT_ENDPOINT}")
+            logger.info("Connecting to AWS IoT Core at %s", IOT_ENDPOINT)
             
             # Build MQTT connection with AWS IoT SDK
             # WHY: Handles TLS, keepalive, reconnection logic
@@ -319,9 +714,30 @@ class IoTSimulator:
                 cert_filepath=IOT_CERT_PATH,
                 pri_key_filepath=IOT_KEY_PATH,
                 ca_filepath=IOT_CA_PATH,
-                client_id=f"station-simulator-{int(time.time())}",  # Unique ID
-                clean_session=False,  # Resume session if disconnect
-                keep_alive_secs=30    # Send ping every 30s
+                client_id=self.client_id,  # Must be unique per connection
+                # WHY clean_session=True: The simulator is stateless and
+                #   publish-only; a persistent session would make the
+                #   broker queue state for us across disconnects for
+                #   nothing
+                clean_session=True,
+                # WHY 1200s: A publisher with steady traffic doesn't
+                #   need frequent PINGREQ heartbeats; 20 min is the AWS
+                #   IoT Core maximum keepalive
+                keep_alive_secs=1200,
+                # Socket tuning (mapped onto awscrt.io.SocketOptions by
+                # the builder)
+                # WHY EXPLICIT CONNECT TIMEOUT: Fail fast instead of
+                #   hanging on an unreachable endpoint
+                tcp_connect_timeout_ms=5000,
+                # WHY TCP KEEPALIVE: With the MQTT keepalive at 20 min,
+                #   kernel-level probes are what notice a dead network
+                #   path promptly between PINGREQs
+                # NOTE: awscrt doesn't expose TCP_NODELAY or SO_SNDBUF /
+                #   SO_RCVBUF; aws-c-io manages those internally
+                tcp_keep_alive=True,
+                tcp_keep_alive_timeout_secs=30,
+                tcp_keep_alive_interval_secs=30,
+                tcp_keep_alive_max_probes=3
             )
             
             # Connect synchronously
@@ -332,89 +748,329 @@ class IoTSimulator:
             logger.info("Successfully connected to AWS IoT Core")
             
         except Exception as e:
-            logger.error(f"Failed to connect to IoT Core: {str(e)}")
+            logger.error("Failed to connect to IoT Core: %s", e)
             raise
     
-    def publish_telemetry(self, station: BatterySwapStation):
+    def _encode_payloads(self, now_iso: str) -> List[bytes]:
         """
-        Publish telemetry message for one station
-        
+        Encode one payload per station in the configured wire format
+
         Args:
-            station: BatterySwapStation to publish data for
-            
+            now_iso: Cycle timestamp shared across all stations
+
+        Returns:
+            List of payload bytes, index-aligned with fleet.station_ids
+
+        ENCODINGS:
+        - json: rendered from the prebuilt per-station templates
+        - msgpack: packed from the fleet's structured snapshot buffer;
+          same field names, ~40-50% fewer bytes on the wire
+        """
+        if self.encoding == 'json':
+            return self.fleet.render_payloads(now_iso)
+
+        rows = self.fleet.snapshot()
+        return [
+            msgpack.packb({
+                'station_id': station_id,
+                'battery_available': int(row['battery_available']),
+                'battery_charging': int(row['battery_charging']),
+                # Already quantized to one decimal during update()
+                'temperature': float(row['temperature']),
+                'humidity': float(row['humidity']),
+                'status': "operational" if row['operational'] else "maintenance",
+                'total_swaps_today': int(row['total_swaps_today']),
+                'last_swap_time': row['last_swap_time'].decode(),
+                'timestamp': now_iso
+            }, use_bin_type=True)
+            for station_id, row in zip(self.fleet.station_ids, rows)
+        ]
+
+    def publish_telemetry(self, station_id: str, payload: bytes) -> Future:
+        """
+        Publish telemetry message for one station without waiting for the ack
+
+        Args:
+            station_id: Station the payload belongs to (topic lookup)
+            payload: Pre-rendered JSON payload bytes (see
+                     StationFleet.render_payloads)
+
+        Returns:
+            Future resolving when the broker acknowledges the publish
+            (None if the publish could not be submitted)
+
         MQTT TOPIC: ev/station/{station_id}/telemetry
-        QoS LEVEL: 1 (at least once delivery)
+        QoS LEVEL: self.qos (default 0 - at most once)
+
+        WHY NOT BLOCK HERE:
+        - Waiting on each ack serializes the loop at one round-trip per
+          station (N stations = N x RTT per cycle)
+        - The SDK's event loop pipelines publishes, so submitting them all
+          and gathering the acks once per cycle costs ~1 RTT total
         """
         try:
-            # Get current telemetry
-            telemetry = station.get_telemetry()
-            
-            # Add timestamp
-            # WHY: Message generation time, not processing time
-            telemetry_dict = telemetry.to_dict()
-            telemetry_dict['timestamp'] = datetime.utcnow().isoformat() + "Z"
-            
-            # Convert to JSON
-            payload = json.dumps(telemetry_dict)
-            
-            # Construct MQTT topic
-            # WHY: Matches IoT Rule filter in Terraform
-            topic = f"{TOPIC_PREFIX}/{station.station_id}/telemetry"
-            
-            # Publish message
-            # QoS 1: Guarantees message delivered at least once
-            # WHY: More reliable than QoS 0, but not duplicate-free like QoS 2
-            publish_future = self.mqtt_connection.publish(
+            # Look up the precomputed MQTT topic
+            # WHY: Matches IoT Rule filter in Terraform; built once at init
+            topic = self.topics[station_id]
+
+            # Guard the broker's payload cap
+            # WHY: Oversized publishes don't fail cleanly - they drop the
+            #   connection, and QoS 1 then retries the same message forever
+            if len(payload) >= IOT_MAX_PAYLOAD_BYTES:
+                logger.error(
+                    "Skipping oversized payload for %s (%d bytes >= %d limit)",
+                    station_id, len(payload), IOT_MAX_PAYLOAD_BYTES
+                )
+                return None
+
+            # Pace below the per-connection publish rate cap
+            self.rate_limiter.acquire()
+
+            # Publish message (returns immediately)
+            # WHY CONFIGURABLE QoS: AT_MOST_ONCE skips the ack round-trip
+            #   entirely; AT_LEAST_ONCE trades latency for delivery
+            # NOTE: The SDK returns (future, packet_id)
+            publish_future, _ = self.mqtt_connection.publish(
                 topic=topic,
                 payload=payload,
-                qos=mqtt.QoS.AT_LEAST_ONCE
+                qos=self.qos
             )
-            
-            # Wait for publish to complete
-            publish_future.result()
-            
-            logger.info(
-                f"Published telemetry for {station.station_id}: "
-                f"batteries={telemetry.battery_available}, temp={telemetry.temperature}°C"
+
+            # Per-message success log is DEBUG
+            # WHY: At INFO this is N eagerly-formatted strings per cycle;
+            #   %-style args aren't formatted unless a handler emits them
+            logger.debug(
+                "Queued telemetry for %s (%d bytes)", station_id, len(payload)
             )
-            
+
+            return publish_future
+
         except Exception as e:
-            logger.error(f"Failed to publish for {station.station_id}: {str(e)}")
-    
+            logger.error("Failed to publish for %s: %s", station_id, e)
+            return None
+
+    def publish_batch(self, now_iso: str) -> List[Future]:
+        """
+        Publish all station telemetry as one batched message per cycle
+
+        Args:
+            now_iso: Cycle timestamp shared across all stations
+
+        WHY BATCHING:
+        - N per-station publishes cost N PUBLISH packets + N PUBACKs plus
+          per-message MQTT/TLS framing; a fleet batch costs 1+1
+        - Small payloads waste framing - concatenating them is friendlier
+          to the network and the broker
+
+        CHUNKING:
+        - AWS IoT rejects payloads over 128 KB, so the batch is split into
+          size-bounded sub-batches when the fleet is large
+
+        Returns:
+            List of publish futures (one per sub-batch)
+        """
+
+        # Encode each station individually so chunks can be sized
+        fragments = self._encode_payloads(now_iso)
+
+        futures: List[Future] = []
+
+        # Greedily pack fragments into size-bounded JSON arrays
+        # WHY: Stay under the 128 KB cap (minus brackets/commas slack)
+        chunk: List[bytes] = []
+        chunk_size = 2  # Account for the enclosing brackets
+        for fragment in fragments:
+            if chunk and chunk_size + len(fragment) + len(chunk) > IOT_MAX_PAYLOAD_BYTES:
+                futures.append(self._publish_chunk(chunk))
+                chunk = []
+                chunk_size = 2
+            chunk.append(fragment)
+            chunk_size += len(fragment)
+        if chunk:
+            futures.append(self._publish_chunk(chunk))
+
+        return [f for f in futures if f is not None]
+
+    def _publish_chunk(self, fragments: List[bytes]) -> Future:
+        """
+        Publish one size-bounded sub-batch to the fleet topic
+
+        Args:
+            fragments: Pre-serialized per-station JSON objects
+
+        Returns:
+            Publish future, or None if the publish could not be submitted
+        """
+        try:
+            if self.encoding == 'json':
+                payload = b'[' + b','.join(fragments) + b']'
+            else:
+                # A msgpack array is just an array header followed by
+                # the already-packed elements
+                payload = (
+                    msgpack.Packer().pack_array_header(len(fragments))
+                    + b''.join(fragments)
+                )
+
+            # Guard the broker's payload cap (chunking should keep us
+            # under it; an oversized publish would drop the connection)
+            if len(payload) >= IOT_MAX_PAYLOAD_BYTES:
+                logger.error(
+                    "Skipping oversized batch (%d bytes >= %d limit)",
+                    len(payload), IOT_MAX_PAYLOAD_BYTES
+                )
+                return None
+
+            # Pace below the per-connection publish rate cap
+            self.rate_limiter.acquire()
+
+            publish_future, _ = self.mqtt_connection.publish(
+                topic=FLEET_TOPIC,
+                payload=payload,
+                qos=self.qos
+            )
+
+            logger.debug(
+                "Queued batch of %d stations (%d bytes) to %s",
+                len(fragments), len(payload), FLEET_TOPIC
+            )
+
+            return publish_future
+
+        except Exception as e:
+            logger.error("Failed to publish batch: %s", e)
+            return None
+
+    async def _gather_acks(self, futures: List[Future], timeout: float):
+        """
+        Await outstanding publish acks without blocking the event loop
+
+        Args:
+            futures: SDK publish futures to await
+            timeout: Maximum seconds to wait
+
+        WHY wrap_future: The SDK resolves concurrent.futures.Future
+        objects on its own CRT event-loop thread; wrapping them lets
+        asyncio await all N acks concurrently, so the whole set costs
+        one round-trip window instead of N sequential waits
+
+        WHY TIMEOUT: A slow broker shouldn't stall the simulation past
+        its cycle budget
+        """
+        wrapped = [asyncio.wrap_future(f) for f in futures]
+        await asyncio.wait(wrapped, timeout=timeout)
+
     def run(self):
         """
-        Main simulation loop
-        
+        Start the simulation (synchronous entry point)
+
+        WHY A WRAPPER: Keeps the CLI call site unchanged while the loop
+        itself runs on an asyncio event loop (see _run_loop)
+        """
+        try:
+            asyncio.run(self._run_loop())
+        except KeyboardInterrupt:
+            logger.info("Simulation stopped by user")
+
+    async def _run_loop(self):
+        """
+        Main simulation loop (asyncio)
+
         LOGIC:
         1. Update all station states
-        2. Publish telemetry for each station
-        3. Sleep for interval
-        4. Repeat forever (until Ctrl+C)
+        2. Submit telemetry publishes (one message per station, or one
+           fleet batch with --batch) without blocking
+        3. Await the publish acks once at end of cycle
+        4. asyncio.sleep until the next cycle deadline
+        5. Repeat forever (until Ctrl+C)
+
+        SCHEDULING:
+        - Deadlines advance by exactly `interval` each cycle and the
+          sleep covers only the remainder, so the publish cadence stays
+          locked to the requested rate instead of drifting by the
+          cycle's work time (sleep(interval) after the work would make
+          the true period interval + work_time)
+
+        WHY ASYNCIO:
+        - The SDK completes all publishes asynchronously on a single
+          event-loop thread; awaiting the wrapped futures overlaps the
+          network latency of N publishes into one RTT window
+        - asyncio.sleep keeps the loop thread free between cycles
         """
         try:
             # Connect to AWS IoT
             self.connect_to_iot()
-            
-            logger.info(f"Starting simulation loop (interval: {self.interval}s)")
+
+            logger.info("Starting simulation loop (interval: %ds)", self.interval)
             logger.info("Press Ctrl+C to stop")
-            
+
+            # Drift-correcting schedule: each cycle's deadline is fixed
+            # relative to the start, not to when the last cycle finished
+            next_deadline = time.monotonic()
+
             # Main loop
             while True:
-                # Update and publish each station
-                for station in self.stations:
-                    station.update()
-                    self.publish_telemetry(station)
-                
-                # Wait before next cycle
-                logger.info(f"Sleeping for {self.interval} seconds...")
-                time.sleep(self.interval)
-        
-        except KeyboardInterrupt:
-            logger.info("Simulation stopped by user")
-        
+                # Timestamp once per cycle, shared by every station
+                now_iso = iso_now()
+
+                # Update the whole fleet in one vectorized pass
+                self.fleet.update(now_iso)
+
+                if self.batch:
+                    # One fleet-level publish per cycle
+                    futures = self.publish_batch(now_iso)
+                    queued = len(futures)
+                else:
+                    # Default mode: one publish per station, non-blocking
+                    futures = []
+                    queued = 0
+                    payloads = self._encode_payloads(now_iso)
+                    for station_id, payload in zip(self.fleet.station_ids, payloads):
+                        publish_future = self.publish_telemetry(station_id, payload)
+                        if publish_future is not None:
+                            futures.append(publish_future)
+                            queued += 1
+
+                        # Respect the broker's unacked-publish ceiling
+                        # WHY: AWS IoT allows 100 unacked QoS 1 publishes
+                        #      per connection; drain before submitting more
+                        if len(futures) >= MAX_INFLIGHT_PUBLISHES:
+                            await self._gather_acks(futures, self.interval)
+                            futures = []
+
+                # Gather remaining acks before sleeping
+                # WHY SKIP AT QoS 0: There are no acks to wait for
+                if futures and self.qos != mqtt.QoS.AT_MOST_ONCE:
+                    await self._gather_acks(futures, self.interval * 0.8)
+
+                # One summary line per cycle
+                # WHY: Replaces N per-station INFO logs with a single
+                #   aggregate; per-message detail is available at DEBUG
+                logger.info(
+                    "Cycle complete: %d stations updated, %d publishes queued",
+                    self.num_stations, queued
+                )
+
+                # Sleep only for the remainder of this cycle's slot
+                next_deadline += self.interval
+                sleep_for = next_deadline - time.monotonic()
+                if sleep_for > 0:
+                    await asyncio.sleep(sleep_for)
+                else:
+                    # The cycle overran its slot - the configured rate
+                    # can't be sustained; warn rather than silently drift
+                    logger.warning(
+                        "Cycle overran the %ds interval by %.2fs; "
+                        "reduce stations or increase the interval",
+                        self.interval, -sleep_for
+                    )
+                    # Rebase so one slow cycle doesn't trigger a burst
+                    # of catch-up cycles
+                    next_deadline = time.monotonic()
+
         except Exception as e:
             logger.error(f"Simulation error: {str(e)}", exc_info=True)
-        
+
         finally:
             # Clean disconnect
             if self.mqtt_connection:
@@ -423,6 +1079,47 @@ class IoTSimulator:
                 disconnect_future.result()
 
 
+# ==============================================================================
+# MULTI-PROCESS PARTITIONING
+# ==============================================================================
+
+def run_partition(job: Dict[str, Any]):
+    """
+    Worker entry point: simulate one partition of the fleet
+
+    Args:
+        job: Partition parameters (index, station count/offset, interval,
+             batch, qos as int, seed, endpoint)
+
+    WHY PARTITIONING:
+    - For thousands of stations a single process is GIL-bound on the
+      Python parts of the loop; P workers scale across cores
+    - Each worker opens its OWN MQTT connection, so fleet throughput
+      also scales past the per-connection broker limits
+
+    WHY A UNIQUE CLIENT ID:
+    - AWS IoT disconnects the older of two connections sharing a client
+      ID, so each partition gets station-simulator-{pid}-{index}
+    """
+    # Endpoint is passed explicitly because the --endpoint override in
+    # the parent's globals doesn't survive into spawned workers
+    global IOT_ENDPOINT
+    if job['endpoint']:
+        IOT_ENDPOINT = job['endpoint']
+
+    simulator = IoTSimulator(
+        num_stations=job['num_stations'],
+        interval=job['interval'],
+        batch=job['batch'],
+        qos=mqtt.QoS.AT_LEAST_ONCE if job['qos'] == 1 else mqtt.QoS.AT_MOST_ONCE,
+        seed=job['seed'],
+        id_offset=job['id_offset'],
+        client_id=f"station-simulator-{os.getpid()}-{job['index']}",
+        encoding=job['encoding']
+    )
+    simulator.run()
+
+
 # ==============================================================================
 # COMMAND LINE INTERFACE
 # ==============================================================================
@@ -458,6 +1155,50 @@ def main():
         type=str,
         help='AWS IoT Core endpoint (overrides default)'
     )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='RNG seed for reproducible simulation runs (default: random)'
+    )
+
+    parser.add_argument(
+        '--qos',
+        type=int,
+        choices=[0, 1],
+        default=0,
+        help='MQTT QoS level: 0 = at most once (default, no ack '
+             'round-trip), 1 = at least once (acked, higher latency)'
+    )
+
+    parser.add_argument(
+        '--encoding',
+        type=str,
+        choices=['json', 'msgpack'],
+        default='json',
+        help='Telemetry wire encoding (default: json). msgpack is '
+             '~40-50%% smaller but requires the IoT Rule / Lambda to '
+             'decode binary payloads'
+    )
+
+    parser.add_argument(
+        '--processes',
+        type=int,
+        default=1,
+        help='Split stations across this many worker processes, each '
+             'with its own MQTT connection (default: 1; use for '
+             'thousands of stations)'
+    )
+
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Publish one fleet-level batch per cycle instead of one '
+             'message per station (far less broker load, but the '
+             'shipped IoT Rule and Lambda only handle per-station '
+             'objects - requires an array-aware downstream)'
+    )
     
     args = parser.parse_args()
     
@@ -473,12 +1214,45 @@ def main():
         logger.error("Find your endpoint: AWS Console > IoT Core > Settings")
         sys.exit(1)
     
-    # Create and run simulator
+    if args.processes > 1:
+        # Split the fleet as evenly as possible across worker processes
+        # WHY divmod: The first `extra` partitions absorb the remainder
+        #   so every station is simulated exactly once
+        base, extra = divmod(args.num_stations, args.processes)
+        jobs = []
+        id_offset = 0
+        for i in range(args.processes):
+            count = base + (1 if i < extra else 0)
+            if count == 0:
+                break
+            jobs.append({
+                'index': i,
+                'num_stations': count,
+                'id_offset': id_offset,
+                'interval': args.interval,
+                'batch': args.batch,
+                'qos': args.qos,
+                'seed': None if args.seed is None else args.seed + i,
+                'endpoint': args.endpoint,
+                'encoding': args.encoding,
+            })
+            id_offset += count
+
+        logger.info("Starting %d partition processes", len(jobs))
+        with multiprocessing.Pool(len(jobs)) as pool:
+            pool.map(run_partition, jobs)
+        return
+
+    # Create and run simulator (single-process path)
     simulator = IoTSimulator(
         num_stations=args.num_stations,
-        interval=args.interval
+        interval=args.interval,
+        batch=args.batch,
+        qos=mqtt.QoS.AT_LEAST_ONCE if args.qos == 1 else mqtt.QoS.AT_MOST_ONCE,
+        seed=args.seed,
+        encoding=args.encoding
     )
-    
+
     simulator.run()
 
 